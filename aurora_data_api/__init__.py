@@ -1,7 +1,8 @@
 """
 aurora-data-api - A Python DB-API 2.0 client for the AWS Aurora Serverless Data API
 """
-import os, datetime, ipaddress, uuid, time, random, string, logging, itertools, reprlib, json, re, threading
+import os, sys, datetime, ipaddress, uuid, logging, itertools, reprlib, json, re, threading, types
+import concurrent.futures
 from decimal import Decimal
 from collections import namedtuple
 from collections.abc import Mapping
@@ -21,7 +22,6 @@ from .exceptions import (
 )
 from .mysql_error_codes import MySQLErrorCodes
 from .postgresql_error_codes import PostgreSQLErrorCodes
-import boto3
 
 apilevel = "2.0"
 
@@ -48,9 +48,163 @@ ColumnDescription.__new__.__defaults__ = (None,) * len(ColumnDescription._fields
 
 logger = logging.getLogger(__name__)
 
+defaults = types.SimpleNamespace(
+    # Number of records requested per FETCH when a query is auto-paginated, and the default fetchmany() size
+    arraysize=int(os.environ.get("AURORA_DATA_API_ARRAYSIZE", 1000)),
+    # Maximum number of parameter sets sent in one BatchExecuteStatement call by executemany()
+    executemany_batch_size=int(os.environ.get("AURORA_DATA_API_EXECUTEMANY_BATCH_SIZE", 1000)),
+    # Number of executemany() batches sent concurrently by cursors that are not in a transaction
+    executemany_parallelism=int(os.environ.get("AURORA_DATA_API_EXECUTEMANY_PARALLELISM", 1)),
+    # Whether auto-paginated queries fetch the next page in the background while the current one is consumed
+    prefetch_pages=os.environ.get("AURORA_DATA_API_PREFETCH_PAGES", "False") == "True",
+)
+
+_mysql_error_pattern = re.compile(r"Error code: (\d+); SQLState: (\d+)$")
+_postgresql_error_pattern = re.compile(r"ERROR: .*(?:\n |;) Position: (\d+); SQLState: (\w+)$")
+# Statements that a connection in "lazy" transaction mode runs outside of a transaction
+_read_only_statement_pattern = re.compile(r"\s*(?:SELECT|SHOW)\b", re.IGNORECASE)
+# Clauses that make a SELECT lock rows or write its results, so that it still needs a transaction in "lazy" mode
+_locking_or_into_pattern = re.compile(
+    r"\b(?:FOR\s+(?:NO\s+KEY\s+)?UPDATE|FOR\s+(?:KEY\s+)?SHARE|LOCK\s+IN\s+SHARE\s+MODE|INTO)\b", re.IGNORECASE
+)
+# fromisoformat on Python < 3.11 rejects fractional seconds that are not 3 or 6 digits long, which the Data API returns
+_fromisoformat_parses_timestamps = sys.version_info >= (3, 11)
+_timestamp_pattern = re.compile(r"(\d{4})-(\d\d)-(\d\d) (\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?$")
+_pg_cursor_name_prefix = __name__.replace(".", "_") + "_"
+_paginate_query_message = "Please paginate your query"
+_set_charset_statement = "SET character_set_client = '{}'"
+_response_size_exceeded_message = "Database returned more than the allowed response size limit"
+# Errors the Data API returns for requests that exceed its request size limit
+_request_size_exceeded_pattern = re.compile(r"(?:request|payload).*(?:size|too large)", re.IGNORECASE)
+
+
+def _get_error_message(error):
+    return getattr(error, "response", {}).get("Error", {}).get("Message", "")
+
+
+def _render_date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _render_time(value):
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        return datetime.datetime.strptime(value, "%H:%M:%S").time()
+
+
+def _render_timestamp(value):
+    if not _fromisoformat_parses_timestamps:
+        match = _timestamp_pattern.match(value)
+        if match:  # Parse the Data API timestamp format directly, which is much faster than strptime
+            year, month, day, hour, minute, second, fraction = match.groups()
+            microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+            return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond)
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        if "." in value:
+            return datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+        return datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+
+def _render_value(value, converter=None, value_field=None):
+    if value_field in value:  # The value is in the field expected for the column type
+        scalar_value = value[value_field]
+    else:
+        # The Data API returns a single field per value, named after the value's type
+        data_api_type, scalar_value = next(iter(value.items()))
+        if data_api_type == "isNull":
+            return None
+        elif data_api_type == "arrayValue":
+            return _render_array(scalar_value)
+    if converter is not None:
+        scalar_value = converter(scalar_value)
+    return scalar_value
+
+
+def _render_array(array_value):
+    # An array value holds a single list, either of scalars or of nested array values
+    array_type, values = next(iter(array_value.items()), (None, []))
+    if array_type == "arrayValues":
+        return [_render_array(nested) for nested in values]
+    return values
+
+
+_pg_type_map = {
+    "int": int,
+    "int2": int,
+    "int4": int,
+    "int8": int,
+    "float4": float,
+    "float8": float,
+    "serial2": int,
+    "serial4": int,
+    "serial8": int,
+    "bool": bool,
+    "varbit": bytes,
+    "bytea": bytearray,
+    "char": str,
+    "varchar": str,
+    "cidr": ipaddress.ip_network,
+    "date": datetime.date,
+    "inet": ipaddress.ip_address,
+    "json": dict,
+    "jsonb": dict,
+    "money": str,
+    "text": str,
+    "time": datetime.time,
+    "timestamp": datetime.datetime,
+    "uuid": uuid.uuid4,
+    "numeric": Decimal,
+    "decimal": Decimal,
+}
+# Python type -> (Data API value field, Data API type hint, conversion applied to the value)
+_data_api_param_types = {
+    bytes: ("blobValue", None, None),
+    bool: ("booleanValue", None, None),
+    float: ("doubleValue", None, None),
+    int: ("longValue", None, None),
+    str: ("stringValue", None, None),
+    Decimal: ("stringValue", "DECIMAL", str),
+    datetime.date: ("stringValue", "DATE", datetime.date.isoformat),
+    datetime.time: ("stringValue", "TIME", datetime.time.isoformat),
+    datetime.datetime: ("stringValue", "TIMESTAMP", str),
+    # list: ("arrayValue", None, None)
+}
+# Type code -> Data API field that holds values of that type (other types are returned in stringValue)
+_data_api_value_fields = {
+    int: "longValue",
+    float: "doubleValue",
+    bool: "booleanValue",
+    bytes: "blobValue",
+    bytearray: "blobValue",
+}
+_type_converters = {
+    datetime.date: _render_date,
+    datetime.time: _render_time,
+    datetime.datetime: _render_timestamp,
+    Decimal: Decimal,
+}
+
 
 class AuroraDataAPIClient:
+    __slots__ = (
+        "_client",
+        "_dbname",
+        "_aurora_cluster_arn",
+        "_secret_arn",
+        "_charset",
+        "_transaction_id",
+        "_continue_after_timeout",
+        "_transaction_mode",
+        "__weakref__",
+    )
     _client_init_lock = threading.Lock()
+    _rds_data_clients = {}
 
     def __init__(
         self,
@@ -60,17 +214,42 @@ class AuroraDataAPIClient:
         rds_data_client=None,
         charset=None,
         continue_after_timeout=None,
+        transaction="eager",
     ):
+        if transaction not in ("eager", "lazy", "none"):
+            raise InterfaceError('Expected transaction to be one of "eager", "lazy" or "none"')
+        if charset and transaction == "none":
+            # The character set is set per transaction, and a SET statement outside of one does not persist
+            raise InterfaceError('The charset argument is not supported with transaction="none"')
         self._client = rds_data_client
         if rds_data_client is None:
-            with self._client_init_lock:
-                self._client = boto3.client("rds-data")
+            self._client = self._get_rds_data_client()
         self._dbname = dbname
         self._aurora_cluster_arn = aurora_cluster_arn or os.environ.get("AURORA_CLUSTER_ARN")
         self._secret_arn = secret_arn or os.environ.get("AURORA_SECRET_ARN")
         self._charset = charset
         self._transaction_id = None
         self._continue_after_timeout = continue_after_timeout
+        self._transaction_mode = transaction
+
+    @classmethod
+    def _get_rds_data_client(cls):
+        # Creating a boto3 client loads and parses the service model, so share one client per session and region
+        import boto3  # Imported here, since importing boto3 is slow and not needed when a client is passed in
+
+        with cls._client_init_lock:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            session = boto3.DEFAULT_SESSION
+            client_key = (session, session.region_name)
+            if client_key not in cls._rds_data_clients:
+                # Only keep clients of the current default session, so that sessions replaced by calls to
+                # boto3.setup_default_session() (and their clients) can be garbage collected
+                cls._rds_data_clients = {
+                    key: client for key, client in cls._rds_data_clients.items() if key[0] is session
+                }
+                cls._rds_data_clients[client_key] = session.client("rds-data")
+            return cls._rds_data_clients[client_key]
 
     def close(self):
         pass
@@ -91,15 +270,34 @@ class AuroraDataAPIClient:
             )
             self._transaction_id = None
 
+    def _begin_transaction(self):
+        res = self._client.begin_transaction(
+            database=self._dbname,
+            resourceArn=self._aurora_cluster_arn,
+            # schema="string", TODO
+            secretArn=self._secret_arn,
+        )
+        self._transaction_id = res["transactionId"]
+
+    def _get_lazy_transaction_id(self, operation):
+        if self._transaction_id is None and (
+            not _read_only_statement_pattern.match(operation) or _locking_or_into_pattern.search(operation)
+        ):
+            self._begin_transaction()
+            if self._charset:
+                # Set the character set once the transaction begins, since setting it in cursor() would begin it early
+                self._client.execute_statement(
+                    database=self._dbname,
+                    resourceArn=self._aurora_cluster_arn,
+                    secretArn=self._secret_arn,
+                    transactionId=self._transaction_id,
+                    sql=_set_charset_statement.format(self._charset),
+                )
+        return self._transaction_id
+
     def cursor(self):
-        if self._transaction_id is None:
-            res = self._client.begin_transaction(
-                database=self._dbname,
-                resourceArn=self._aurora_cluster_arn,
-                # schema="string", TODO
-                secretArn=self._secret_arn,
-            )
-            self._transaction_id = res["transactionId"]
+        if self._transaction_id is None and self._transaction_mode == "eager":
+            self._begin_transaction()
         cursor = AuroraDataAPICursor(
             client=self._client,
             dbname=self._dbname,
@@ -107,9 +305,10 @@ class AuroraDataAPIClient:
             secret_arn=self._secret_arn,
             transaction_id=self._transaction_id,
             continue_after_timeout=self._continue_after_timeout,
+            connection=self if self._transaction_mode == "lazy" else None,
         )
-        if self._charset:
-            cursor.execute("SET character_set_client = '{}'".format(self._charset))
+        if self._charset and self._transaction_mode == "eager":
+            cursor.execute(_set_charset_statement.format(self._charset))
         return cursor
 
     def __enter__(self):
@@ -123,49 +322,27 @@ class AuroraDataAPIClient:
 
 
 class AuroraDataAPICursor:
-    _pg_type_map = {
-        "int": int,
-        "int2": int,
-        "int4": int,
-        "int8": int,
-        "float4": float,
-        "float8": float,
-        "serial2": int,
-        "serial4": int,
-        "serial8": int,
-        "bool": bool,
-        "varbit": bytes,
-        "bytea": bytearray,
-        "char": str,
-        "varchar": str,
-        "cidr": ipaddress.ip_network,
-        "date": datetime.date,
-        "inet": ipaddress.ip_address,
-        "json": dict,
-        "jsonb": dict,
-        "money": str,
-        "text": str,
-        "time": datetime.time,
-        "timestamp": datetime.datetime,
-        "uuid": uuid.uuid4,
-        "numeric": Decimal,
-        "decimal": Decimal,
-    }
-    _data_api_type_map = {
-        bytes: "blobValue",
-        bool: "booleanValue",
-        float: "doubleValue",
-        int: "longValue",
-        str: "stringValue",
-        Decimal: "stringValue",
-        # list: "arrayValue"
-    }
-    _data_api_type_hint_map = {
-        datetime.date: "DATE",
-        datetime.time: "TIME",
-        datetime.datetime: "TIMESTAMP",
-        Decimal: "DECIMAL",
-    }
+    __slots__ = (
+        "arraysize",
+        "_column_metadata",
+        "_description",
+        "_column_type_codes",
+        "_column_converters",
+        "_column_value_fields",
+        "_client",
+        "_bad_request_exception",
+        "_database_error_exception",
+        "_dbname",
+        "_aurora_cluster_arn",
+        "_secret_arn",
+        "_transaction_id",
+        "_current_response",
+        "_iterator",
+        "_paging_state",
+        "_continue_after_timeout",
+        "_connection",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -175,10 +352,14 @@ class AuroraDataAPICursor:
         secret_arn=None,
         transaction_id=None,
         continue_after_timeout=None,
+        connection=None,
     ):
-        self.arraysize = 1000
-        self.description = None
+        self.arraysize = defaults.arraysize
+        self._set_description(None)
         self._client = client
+        # botocore exposes modeled client errors through a dynamic attribute lookup, so resolve them once per cursor
+        self._bad_request_exception = client.exceptions.BadRequestException if client is not None else ()
+        self._database_error_exception = client.exceptions.DatabaseErrorException if client is not None else ()
         self._dbname = dbname
         self._aurora_cluster_arn = aurora_cluster_arn
         self._secret_arn = secret_arn
@@ -187,50 +368,128 @@ class AuroraDataAPICursor:
         self._iterator = None
         self._paging_state = None
         self._continue_after_timeout = continue_after_timeout
+        self._connection = connection
 
     def prepare_param(self, param_name, param_value):
         if param_value is None:
-            return dict(name=param_name, value=dict(isNull=True))
-        param_data_api_type = self._data_api_type_map.get(type(param_value), "stringValue")
-        param = dict(name=param_name, value={param_data_api_type: param_value})
-        if param_data_api_type == "stringValue" and not isinstance(param_value, str):
-            param["value"][param_data_api_type] = str(param_value)
-        if type(param_value) in self._data_api_type_hint_map:
-            param["typeHint"] = self._data_api_type_hint_map[type(param_value)]
-        return param
+            return {"name": param_name, "value": {"isNull": True}}
+        param_type = _data_api_param_types.get(type(param_value))
+        if param_type is None:
+            if not isinstance(param_value, str):
+                param_value = str(param_value)
+            return {"name": param_name, "value": {"stringValue": param_value}}
+        param_data_api_type, param_type_hint, param_cast = param_type
+        if param_cast:
+            param_value = param_cast(param_value)
+        if param_type_hint:
+            return {"name": param_name, "value": {param_data_api_type: param_value}, "typeHint": param_type_hint}
+        return {"name": param_name, "value": {param_data_api_type: param_value}}
 
         # if param_data_api_type == "arrayValue" and len(param_value) > 0:
         #     return {
         #         param_data_api_type: {
-        #             self._data_api_type_map.get(type(param_value[0]), "stringValue") + "s": param_value
+        #             _data_api_param_types.get(type(param_value[0]), ("stringValue",))[0] + "s": param_value
         #         }
         #     }
 
+    @property
+    def description(self):
+        # Built on first access, since most callers never read the description of a result set
+        if self._description is None and self._column_metadata is not None:
+            self._description = [
+                ColumnDescription(name=column["name"], type_code=type_code)
+                for column, type_code in zip(self._column_metadata, self._column_type_codes)
+            ]
+        return self._description
+
     def _set_description(self, column_metadata):
         # see https://www.postgresql.org/docs/9.5/datatype.html
-        self.description = []
-        for column in column_metadata:
-            col_desc = ColumnDescription(
-                name=column["name"], type_code=self._pg_type_map.get(column["typeName"].lower(), str)
-            )
-            self.description.append(col_desc)
+        self._column_metadata = column_metadata
+        self._description = None
+        if column_metadata is None:
+            self._column_type_codes = self._column_converters = self._column_value_fields = None
+            return
+        self._column_type_codes = [_pg_type_map.get(column["typeName"].lower(), str) for column in column_metadata]
+        self._column_converters = [_type_converters.get(type_code) for type_code in self._column_type_codes]
+        self._column_value_fields = [
+            _data_api_value_fields.get(type_code, "stringValue") for type_code in self._column_type_codes
+        ]
 
     def _start_paginated_query(self, execute_statement_args, records_per_page=None):
         # MySQL cursors are non-scrollable (https://dev.mysql.com/doc/refman/8.0/en/cursors.html)
         # - may not support page autosizing
         # - FETCH requires INTO - may need to write all results into a server side var and iterate on it
-        pg_cursor_name = "{}_{}_{}".format(
-            __name__, int(time.time()), "".join(random.choices(string.ascii_letters + string.digits, k=8))
-        )
+        pg_cursor_name = _pg_cursor_name_prefix + uuid.uuid4().hex
         cursor_stmt = "DECLARE " + pg_cursor_name + " SCROLL CURSOR FOR "
         execute_statement_args["sql"] = cursor_stmt + execute_statement_args["sql"]
-        self._client.execute_statement(**execute_statement_args)
+        paging_transaction_id = None
+        if "transactionId" not in execute_statement_args:
+            # Server-side cursors only exist within a transaction, so statements that run outside of one are paginated
+            # in a transaction of their own
+            res = self._client.begin_transaction(
+                database=self._dbname, resourceArn=self._aurora_cluster_arn, secretArn=self._secret_arn
+            )
+            paging_transaction_id = execute_statement_args["transactionId"] = res["transactionId"]
+        try:
+            self._client.execute_statement(**execute_statement_args)
+        except Exception:
+            if paging_transaction_id is not None:
+                self._end_paging_transaction(paging_transaction_id, commit=False, ignore_errors=True)
+            raise
+        # FETCH and MOVE statements take no parameters, so only keep the arguments that apply to them; the statement
+        # itself is passed separately on each call
+        paging_args = (
+            "database",
+            "resourceArn",
+            "secretArn",
+            "transactionId",
+            "includeResultMetadata",
+            "continueAfterTimeout",
+        )
         self._paging_state = {
-            "execute_statement_args": dict(execute_statement_args),
+            "execute_statement_args": {
+                k: execute_statement_args[k] for k in paging_args if k in execute_statement_args
+            },
             "records_per_page": records_per_page or self.arraysize,
             "pg_cursor_name": pg_cursor_name,
+            "fetch_stmt": "FETCH {} FROM " + pg_cursor_name,
+            "transaction_id": paging_transaction_id,
         }
 
+    def _close_iterator(self):
+        # Closing the generator of a paginated query waits for the page being prefetched, if any, so that no other
+        # Data API call can overlap with it
+        if isinstance(self._iterator, types.GeneratorType):
+            self._iterator.close()
+        self._iterator = None
+
+    def _end_paginated_query(self, commit=True, ignore_errors=False):
+        # Ends the transaction that a statement run outside of a transaction was paginated in, if any
+        paging_state = self._paging_state
+        if paging_state is None or paging_state["transaction_id"] is None:
+            return
+        self._paging_state = None
+        self._end_paging_transaction(paging_state["transaction_id"], commit=commit, ignore_errors=ignore_errors)
+
+    def _end_paging_transaction(self, transaction_id, commit=True, ignore_errors=False):
+        end_transaction = self._client.commit_transaction if commit else self._client.rollback_transaction
+        try:
+            end_transaction(
+                resourceArn=self._aurora_cluster_arn, secretArn=self._secret_arn, transactionId=transaction_id
+            )
+        except Exception as e:
+            # The Data API deletes the transaction of a statement that failed (for example, by exceeding the response
+            # size limit), so on cleanup paths this must not replace the error that ended the query
+            if not ignore_errors:
+                raise
+            logger.warning("Failed to end the transaction of a paginated query: %s", e)
+
+    def _join_lazy_transaction(self, operation):
+        # Cursors of connections in "lazy" transaction mode use the connection's current transaction, which is only
+        # begun by the first statement that may write
+        if self._connection is not None:
+            self._transaction_id = self._connection._get_lazy_transaction_id(operation)
+
     def _prepare_execute_args(self, operation):
         execute_args = dict(
             database=self._dbname, resourceArn=self._aurora_cluster_arn, secretArn=self._secret_arn, sql=operation
@@ -240,48 +499,57 @@ class AuroraDataAPICursor:
         return execute_args
 
     def _format_parameter_set(self, parameters):
-        if not isinstance(parameters, Mapping):
+        # Check for dict first, which avoids the slower abstract base class check for the common case
+        if not isinstance(parameters, (dict, Mapping)):
             raise NotSupportedError("Expected a mapping of parameters. Array parameters are not supported.")
-        return [self.prepare_param(k, v) for k, v in parameters.items()]
+        prepare_param = self.prepare_param
+        return [prepare_param(k, v) for k, v in parameters.items()]
 
     def _get_database_error(self, original_error):
-        error_msg = getattr(original_error, "response", {}).get("Error", {}).get("Message", "")
+        error_msg = _get_error_message(original_error)
+        response = getattr(original_error, "response", {})
         try:
-            res = re.search(r"Error code: (\d+); SQLState: (\d+)$", error_msg)
+            res = _mysql_error_pattern.search(error_msg)
             if res:  # MySQL error
                 error_code = int(res.group(1))
                 error_class = MySQLError.from_code(error_code)
                 error = error_class(error_msg)
-                error.response = getattr(original_error, "response", {})
+                error.response = response
                 return error
-            res = re.search(r"ERROR: .*(?:\n |;) Position: (\d+); SQLState: (\w+)$", error_msg)
+            res = _postgresql_error_pattern.search(error_msg)
             if res:  # PostgreSQL error
                 error_code = res.group(2)
                 error_class = PostgreSQLError.from_code(error_code)
                 error = error_class(error_msg)
-                error.response = getattr(original_error, "response", {})
+                error.response = response
                 return error
         except Exception:
             pass
         return DatabaseError(original_error)
 
     def execute(self, operation, parameters=None):
-        self._current_response, self._iterator, self._paging_state = None, None, None
+        self._close_iterator()
+        self._end_paginated_query(ignore_errors=True)
+        self._current_response, self._paging_state = None, None
+        self._set_description(None)
+        self._join_lazy_transaction(operation)
         execute_statement_args = dict(self._prepare_execute_args(operation), includeResultMetadata=True)
         if self._continue_after_timeout is not None:
             execute_statement_args["continueAfterTimeout"] = self._continue_after_timeout
         if parameters:
             execute_statement_args["parameters"] = self._format_parameter_set(parameters)
-        logger.debug("execute %s", reprlib.repr(operation.strip()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("execute %s", reprlib.repr(operation.strip()))
         try:
             res = self._client.execute_statement(**execute_statement_args)
             if "columnMetadata" in res:
                 self._set_description(res["columnMetadata"])
             self._current_response = self._render_response(res)
-        except (self._client.exceptions.BadRequestException, self._client.exceptions.DatabaseErrorException) as e:
-            if "Please paginate your query" in str(e):
+        except (self._bad_request_exception, self._database_error_exception) as e:
+            error_msg = _get_error_message(e)
+            if _paginate_query_message in error_msg:
                 self._start_paginated_query(execute_statement_args)
-            elif "Database returned more than the allowed response size limit" in str(e):
+            elif _response_size_exceeded_message in error_msg:
                 self._start_paginated_query(execute_statement_args, records_per_page=max(1, self.arraysize // 2))
             else:
                 raise self._get_database_error(e) from e
@@ -300,58 +568,75 @@ class AuroraDataAPICursor:
     def lastrowid(self):
         # TODO: this may not make sense if the previous statement is not an INSERT
         if self._current_response and self._current_response.get("generatedFields"):
-            return self._render_value(self._current_response["generatedFields"][-1])
-
-    def _page_input(self, iterable, page_size=1000):
-        iterable = iter(iterable)
-        return iter(lambda: list(itertools.islice(iterable, page_size)), [])
+            return _render_value(self._current_response["generatedFields"][-1])
+
+    def _page_input(self, iterable, batching_state):
+        # The page size is read for every page, so pages after a batch was split use the lowered batch size
+        if isinstance(iterable, (list, tuple)):
+            start = 0
+            while start < len(iterable):
+                end = start + batching_state["batch_size"]
+                yield iterable[start:end]
+                start = end
+        else:
+            iterable = iter(iterable)
+            yield from iter(lambda: list(itertools.islice(iterable, batching_state["batch_size"])), [])
 
     def executemany(self, operation, seq_of_parameters):
-        logger.debug("executemany %s", reprlib.repr(operation.strip()))
-        for batch in self._page_input(seq_of_parameters):
-            batch_execute_statement_args = dict(
-                self._prepare_execute_args(operation), parameterSets=[self._format_parameter_set(p) for p in batch]
-            )
-            try:
-                self._client.batch_execute_statement(**batch_execute_statement_args)
-            except self._client.exceptions.BadRequestException as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("executemany %s", reprlib.repr(operation.strip()))
+        self._join_lazy_transaction(operation)
+        execute_args = self._prepare_execute_args(operation)
+        format_parameter_set = self._format_parameter_set
+        batching_state = {"batch_size": defaults.executemany_batch_size}
+        # Encode each page as it is sent, so only the encoded parameter sets of a page are held
+        batches = (
+            [format_parameter_set(p) for p in page] for page in self._page_input(seq_of_parameters, batching_state)
+        )
+        if defaults.executemany_parallelism > 1 and self._transaction_id is None:
+            # Statements within a transaction run one at a time, so batches are only sent concurrently without one
+            with concurrent.futures.ThreadPoolExecutor(max_workers=defaults.executemany_parallelism) as executor:
+                # Only keep as many batches in flight as can run at once, submitting the next one as each completes,
+                # so the remaining batches are not all encoded ahead of time
+                pending = {
+                    executor.submit(self._execute_batch, execute_args, batch, batching_state)
+                    for batch in itertools.islice(batches, defaults.executemany_parallelism)
+                }
+                while pending:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        for batch in itertools.islice(batches, 1):
+                            pending.add(executor.submit(self._execute_batch, execute_args, batch, batching_state))
+        else:
+            for batch in batches:
+                self._execute_batch(execute_args, batch, batching_state)
+
+    def _execute_batch(self, execute_args, parameter_sets, batching_state):
+        try:
+            self._client.batch_execute_statement(**execute_args, parameterSets=parameter_sets)
+        except self._bad_request_exception as e:
+            if len(parameter_sets) > 1 and _request_size_exceeded_pattern.search(_get_error_message(e)):
+                # Halve the batch size for the rest of this batch and for the batches after it
+                batching_state["batch_size"] = min(batching_state["batch_size"], len(parameter_sets) // 2)
+                logger.debug("Lowering batch size to %d", batching_state["batch_size"])
+                start = 0
+                while start < len(parameter_sets):
+                    end = start + batching_state["batch_size"]
+                    self._execute_batch(execute_args, parameter_sets[start:end], batching_state)
+                    start = end
+            else:
                 raise self._get_database_error(e) from e
 
     def _render_response(self, response):
         if "records" in response:
-            for i, record in enumerate(response["records"]):
-                response["records"][i] = tuple(
-                    self._render_value(value, col_desc=self.description[j] if self.description else None)
-                    for j, value in enumerate(record)
-                )
+            response["records"] = list(self._render_records(response["records"]))
         return response
 
-    def _render_value(self, value, col_desc=None):
-        if value.get("isNull"):
-            return None
-        elif "arrayValue" in value:
-            if "arrayValues" in value["arrayValue"]:
-                return [self._render_value(nested) for nested in value["arrayValue"]["arrayValues"]]
-            else:
-                return list(value["arrayValue"].values())[0]
-        else:
-            scalar_value = list(value.values())[0]
-            if col_desc and col_desc.type_code in self._data_api_type_hint_map:
-                if col_desc.type_code == Decimal:
-                    scalar_value = Decimal(scalar_value)
-                else:
-                    try:
-                        scalar_value = col_desc.type_code.fromisoformat(scalar_value)
-                    except (AttributeError, ValueError):  # fromisoformat not supported on Python < 3.7
-                        if col_desc.type_code == datetime.date:
-                            scalar_value = datetime.datetime.strptime(scalar_value, "%Y-%m-%d").date()
-                        elif col_desc.type_code == datetime.time:
-                            scalar_value = datetime.datetime.strptime(scalar_value, "%H:%M:%S").time()
-                        elif "." in scalar_value:
-                            scalar_value = datetime.datetime.strptime(scalar_value, "%Y-%m-%d %H:%M:%S.%f")
-                        else:
-                            scalar_value = datetime.datetime.strptime(scalar_value, "%Y-%m-%d %H:%M:%S")
-            return scalar_value
+    def _render_records(self, records):
+        converters = self._column_converters or itertools.repeat(None)
+        value_fields = self._column_value_fields or itertools.repeat(None)
+        return (tuple(map(_render_value, record, converters, value_fields)) for record in records)
 
     def scroll(self, value, mode="relative"):
         if not self._paging_state:
@@ -359,40 +644,58 @@ class AuroraDataAPICursor:
         scroll_stmt = "MOVE {mode} {value} FROM {pg_cursor_name}".format(
             mode=mode.upper(), value=value, **self._paging_state
         )
-        scroll_args = dict(self._paging_state["execute_statement_args"], sql=scroll_stmt)
         logger.debug("Scrolling cursor %s by %d rows", mode, value)
-        self._client.execute_statement(**scroll_args)
-
-    def __iter__(self):
-        if self._paging_state:
-            next_page_args = self._paging_state["execute_statement_args"]
+        self._client.execute_statement(**self._paging_state["execute_statement_args"], sql=scroll_stmt)
+
+    def _fetch_page(self):
+        paging_state = self._paging_state
+        next_page_args = paging_state["execute_statement_args"]
+        execute_statement = self._client.execute_statement
+        while True:
+            records_per_page = paging_state["records_per_page"]
+            logger.debug("Fetching page of %d records for auto-paginated query", records_per_page)
+            fetch_stmt = paging_state["fetch_stmt"].format(records_per_page)
+            try:
+                page = execute_statement(**next_page_args, sql=fetch_stmt)
+            except self._bad_request_exception as e:
+                if _response_size_exceeded_message in _get_error_message(e) and records_per_page > 1:
+                    self.scroll(-records_per_page)  # Rewind the cursor to read the page again
+                    logger.debug("Halving records per page")
+                    paging_state["records_per_page"] //= 2
+                    continue
+                else:
+                    raise self._get_database_error(e) from e
+
+            if "columnMetadata" in page and not self._column_metadata:
+                self._set_description(page["columnMetadata"])
+            next_page_args.pop("includeResultMetadata", None)  # Column metadata is only needed from the first page
+            return page
+
+    def _iter_pages(self):
+        fetch_page, render_records = self._fetch_page, self._render_records
+        if defaults.prefetch_pages:
+            # Fetch the next page in the background while the records of the current page are consumed
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                next_page = executor.submit(fetch_page)
+                while True:
+                    page = next_page.result()
+                    if len(page["records"]) == 0:
+                        break
+                    next_page = executor.submit(fetch_page)
+                    yield from render_records(page["records"])
+        else:
             while True:
-                logger.debug(
-                    "Fetching page of %d records for auto-paginated query", self._paging_state["records_per_page"]
-                )
-                next_page_args["sql"] = "FETCH {records_per_page} FROM {pg_cursor_name}".format(**self._paging_state)
-                try:
-                    page = self._client.execute_statement(**next_page_args)
-                except self._client.exceptions.BadRequestException as e:
-                    cur_rpp = self._paging_state["records_per_page"]
-                    if "Database returned more than the allowed response size limit" in str(e) and cur_rpp > 1:
-                        self.scroll(-self._paging_state["records_per_page"])  # Rewind the cursor to read the page again
-                        logger.debug("Halving records per page")
-                        self._paging_state["records_per_page"] //= 2
-                        continue
-                    else:
-                        raise self._get_database_error(e) from e
-
-                if "columnMetadata" in page and not self.description:
-                    self._set_description(page["columnMetadata"])
+                page = fetch_page()
                 if len(page["records"]) == 0:
                     break
-                page = self._render_response(page)
-                for record in page["records"]:
-                    yield record
-        else:
-            for record in self._current_response.get("records", []):
-                yield record
+                yield from render_records(page["records"])
+        self._end_paginated_query()
+
+    def __iter__(self):
+        if self._paging_state:
+            return self._iter_pages()
+        # Records of a non-paginated response are already rendered, so iterate over them directly
+        return iter(self._current_response.get("records", []))
 
     def fetchone(self):
         try:
@@ -403,14 +706,7 @@ class AuroraDataAPICursor:
     def fetchmany(self, size=None):
         if size is None:
             size = self.arraysize
-        results = []
-        while size > 0:
-            result = self.fetchone()
-            if result is None:
-                break
-            results.append(result)
-            size -= 1
-        return results
+        return list(itertools.islice(self._iterator, max(size, 0)))
 
     def fetchall(self):
         return list(self._iterator)
@@ -422,13 +718,15 @@ class AuroraDataAPICursor:
         pass
 
     def close(self):
-        pass
+        self._close_iterator()
+        self._end_paginated_query(ignore_errors=True)
 
     def __enter__(self):
         return self
 
     def __exit__(self, err_type, value, traceback):
-        self._iterator = None
+        self._close_iterator()
+        self._end_paginated_query(commit=err_type is None, ignore_errors=True)
         self._current_response = None
 
 
@@ -443,6 +741,7 @@ def connect(
     password=None,
     charset=None,
     continue_after_timeout=None,
+    transaction="eager",
 ):
     return AuroraDataAPIClient(
         dbname=database,
@@ -451,4 +750,5 @@ def connect(
         rds_data_client=rds_data_client,
         charset=charset,
         continue_after_timeout=continue_after_timeout,
+        transaction=transaction,
     )
@@ -1,3 +1,5 @@
+import functools
+
 from .mysql_error_codes import MySQLErrorCodes
 from .postgresql_error_codes import PostgreSQLErrorCodes
 
@@ -44,20 +46,33 @@ class NotSupportedError(DatabaseError):
 
 class _DatabaseErrorFactory:
     def __getattr__(self, a):
-        err_cls = type(getattr(self.err_index, a).name, (DatabaseError,), {})
+        err_name = getattr(self.err_index, a).name
+        if err_name != a:  # Aliases of an error code resolve to the class of its canonical name
+            err_cls = getattr(self, err_name)
+        else:
+            err_cls = type(err_name, (DatabaseError,), {})
+            # Error classes are reachable as attributes of the module-level factory, which lets pickle find them by name
+            err_cls.__qualname__ = self.factory_name + "." + err_name
         setattr(self, a, err_cls)
         return err_cls
 
+    def __reduce__(self):
+        # Pickle the factory by reference, so unpickled error classes resolve to the same class objects
+        return self.factory_name
+
+    @functools.lru_cache(maxsize=None)
     def from_code(self, err_code):
         return getattr(self, self.err_index(err_code).name)
 
 
 class _MySQLErrorFactory(_DatabaseErrorFactory):
     err_index = MySQLErrorCodes
+    factory_name = "MySQLError"
 
 
 class _PostgreSQLErrorFactory(_DatabaseErrorFactory):
     err_index = PostgreSQLErrorCodes
+    factory_name = "PostgreSQLError"
 
 
 MySQLError = _MySQLErrorFactory()
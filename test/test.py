@@ -3,6 +3,7 @@ import decimal
 import json
 import logging
 import os
+import pickle
 import sys
 import unittest
 
@@ -13,16 +14,26 @@ from aurora_data_api.mysql_error_codes import MySQLErrorCodes  # noqa
 from aurora_data_api.postgresql_error_codes import PostgreSQLErrorCodes  # noqa
 
 logging.basicConfig(level=logging.INFO)
-logging.getLogger("aurora_data_api").setLevel(logging.DEBUG)
-logging.getLogger("urllib3.connectionpool").setLevel(logging.DEBUG)
+if os.environ.get("TEST_DEBUG_LOGGING", "False") == "True":
+    logging.getLogger("aurora_data_api").setLevel(logging.DEBUG)
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.DEBUG)
 
 
 class TestAuroraDataAPI(unittest.TestCase):
     using_mysql = False
+    # Keep the test table between runs and reuse it if it is intact, which saves seeding it on repeated local runs
+    reuse_test_table = os.environ.get("TEST_REUSE_TABLE", "False") == "True"
+    # Concatenating 32 copies of doc makes the result of this query exceed the Data API response size limit, so it is
+    # paginated (PostgreSQL only); pages of 50 rows stay well under the limit
+    paginated_query = "select id, concat({}) from aurora_data_api_test order by id".format(
+        ", ".join(["cast(doc as text)"] * 32)
+    )
 
     @classmethod
     def setUpClass(cls):
         cls.db_name = os.environ.get("AURORA_DB_NAME", __name__)
+        if cls.reuse_test_table and cls.load_test_table():
+            return
         with aurora_data_api.connect(database=cls.db_name) as conn, conn.cursor() as cur:
             try:
                 cur.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
@@ -45,10 +56,12 @@ class TestAuroraDataAPI(unittest.TestCase):
                 """,
                     [
                         {
-                            "name": "row{}".format(i),
+                            "name": f"row{i}",
                             # Note: data api v1 supports up to 512**512 but v2 only supports up to 128**128
-                            "doc": json.dumps({"x": i, "y": str(i), "z": [i, i * i, i**i if i < 128 else 0]}),
-                            "num": decimal.Decimal("%d.%d" % (i, i)),
+                            "doc": json.dumps(
+                                {"x": i, "y": str(i), "z": [i, i * i, i**i if i < 128 else 0]}, separators=(",", ":")
+                            ),
+                            "num": decimal.Decimal(f"{i}.{i}"),
                             "ts": "2020-09-17 13:49:32.780180",
                         }
                         for i in range(2048)
@@ -68,17 +81,32 @@ class TestAuroraDataAPI(unittest.TestCase):
                     ),
                     [
                         {
-                            "name": "row{}".format(i),
+                            "name": f"row{i}",
                             "birthday": "2000-01-01",
-                            "num": decimal.Decimal("%d.%d" % (i, i)),
+                            "num": decimal.Decimal(f"{i}.{i}"),
                             "ts": "2020-09-17 13:49:32.780180",
                         }
                         for i in range(2048)
                     ],
                 )
 
+    @classmethod
+    def load_test_table(cls):
+        with aurora_data_api.connect(database=cls.db_name, transaction="lazy") as conn, conn.cursor() as cur:
+            try:
+                cur.execute("select * from aurora_data_api_test where name = 'row2047'")
+            except aurora_data_api.DatabaseError:
+                return False
+            if cur.rowcount != 1:
+                return False
+            cls.using_mysql = cur.description[2].name == "birthday"
+            cur.execute("select count(*) from aurora_data_api_test")
+            return cur.fetchone()[0] == 2048
+
     @classmethod
     def tearDownClass(cls):
+        if cls.reuse_test_table:
+            return
         with aurora_data_api.connect(database=cls.db_name) as conn, conn.cursor() as cur:
             cur.execute("DROP TABLE IF EXISTS aurora_data_api_test")
 
@@ -90,16 +118,20 @@ class TestAuroraDataAPI(unittest.TestCase):
                 cur.execute("selec * from table")
 
     def test_iterators(self):
-        with aurora_data_api.connect(database=self.db_name) as conn, conn.cursor() as cur:
+        # Read-only tests use lazy connections, which skip the BeginTransaction and CommitTransaction round trips
+        with aurora_data_api.connect(database=self.db_name, transaction="lazy") as conn, conn.cursor() as cur:
             if not self.using_mysql:
-                cur.execute("select count(*) from aurora_data_api_test where pg_column_size(doc) < :s", dict(s=2**6))
-                self.assertEqual(cur.fetchone()[0], 0)
-                cur.execute("select count(*) from aurora_data_api_test where pg_column_size(doc) < :s", dict(s=2**7))
-                self.assertEqual(cur.fetchone()[0], 1977)
-                cur.execute("select count(*) from aurora_data_api_test where pg_column_size(doc) < :s", dict(s=2**8))
-                self.assertEqual(cur.fetchone()[0], 2048)
-                cur.execute("select count(*) from aurora_data_api_test where pg_column_size(doc) < :s", dict(s=2**10))
-                self.assertEqual(cur.fetchone()[0], 2048)
+                cur.execute(
+                    """
+                    select count(*) filter (where pg_column_size(doc) < :s6),
+                           count(*) filter (where pg_column_size(doc) < :s7),
+                           count(*) filter (where pg_column_size(doc) < :s8),
+                           count(*) filter (where pg_column_size(doc) < :s10)
+                    from aurora_data_api_test
+                    """,
+                    dict(s6=2**6, s7=2**7, s8=2**8, s10=2**10),
+                )
+                self.assertEqual(cur.fetchone(), (0, 1977, 2048, 2048))
 
             with conn.cursor() as cursor:
                 expect_row0 = (
@@ -126,7 +158,7 @@ class TestAuroraDataAPI(unittest.TestCase):
                 self.assertEqual(data[-1][0], 2048)
                 self.assertEqual(data[-1][1], "row2047")
                 if not self.using_mysql:
-                    self.assertEqual(json.loads(data[-1][2]), {"x": 2047, "y": str(2047), "z": [2047, 2047 * 2047, 0]})
+                    self.assertEqual(data[-1][2], '{"x":2047,"y":"2047","z":[2047,4190209,0]}')
                 self.assertEqual(data[-1][-2], decimal.Decimal("2047.2047"))
                 self.assertEqual(len(data), 2048)
                 self.assertEqual(len(cursor.fetchall()), 0)
@@ -140,11 +172,104 @@ class TestAuroraDataAPI(unittest.TestCase):
                 self.assertEqual(i, 2048)
 
                 cursor.execute("select * from aurora_data_api_test")
+                page_sizes = []
                 while True:
                     fm = cursor.fetchmany(1001)
                     if not fm:
                         break
-                    self.assertIn(len(fm), [1001, 46])
+                    page_sizes.append(len(fm))
+                self.assertEqual(page_sizes, [1001, 1001, 46])
+
+    def get_paging_transaction_id(self, cursor):
+        # The query must have been paginated in a transaction of its own for the checks that use this to be meaningful
+        self.assertIsNotNone(cursor._paging_state)
+        self.assertIsNotNone(cursor._paging_state["transaction_id"])
+        return cursor._paging_state["transaction_id"]
+
+    def assertTransactionEnded(self, conn, transaction_id):
+        with self.assertRaises(conn._client.exceptions.ClientError):
+            conn._client.rollback_transaction(
+                resourceArn=conn._aurora_cluster_arn, secretArn=conn._secret_arn, transactionId=transaction_id
+            )
+
+    def test_transaction_modes(self):
+        with self.assertRaises(aurora_data_api.InterfaceError):
+            aurora_data_api.connect(database=self.db_name, transaction="bogus")
+
+        # Lazy connections begin their transaction on the first write, and roll it back if the block raises
+        with self.assertRaises(ValueError):
+            with aurora_data_api.connect(database=self.db_name, transaction="lazy") as conn, conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM aurora_data_api_test WHERE name = 'lazy_rollback'")
+                self.assertIsNone(conn._transaction_id)
+                cur.execute("INSERT INTO aurora_data_api_test(name) VALUES ('lazy_rollback')")
+                self.assertIsNotNone(conn._transaction_id)
+                raise ValueError()
+        with aurora_data_api.connect(database=self.db_name, transaction="lazy") as conn, conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM aurora_data_api_test WHERE name = 'lazy_rollback'")
+            self.assertEqual(cur.fetchone(), (0,))
+
+    def test_pagination_outside_transaction(self):
+        if self.using_mysql:
+            self.skipTest("Not implemented for MySQL")
+        sql = self.paginated_query
+        for transaction in "none", "lazy":
+            with self.subTest(transaction=transaction):
+                with aurora_data_api.connect(database=self.db_name, transaction=transaction) as conn:
+                    with conn.cursor() as cur:
+                        cur.arraysize = 50
+                        cur.execute(sql)
+                        transaction_id = self.get_paging_transaction_id(cur)
+                        self.assertEqual([row[0] for row in cur.fetchall()], list(range(1, 2049)))
+                        self.assertTransactionEnded(conn, transaction_id)
+
+                        cur.execute(sql)
+                        transaction_id = self.get_paging_transaction_id(cur)
+                        self.assertEqual([row[0] for row in cur.fetchmany(10)], list(range(1, 11)))
+                        cur.execute("select count(*) from aurora_data_api_test")
+                        self.assertEqual(cur.fetchone(), (2048,))
+                        self.assertTransactionEnded(conn, transaction_id)
+
+                        cur.execute(sql)
+                        transaction_id = self.get_paging_transaction_id(cur)
+                        self.assertEqual(cur.fetchone()[0], 1)
+                        cur.close()
+                        self.assertTransactionEnded(conn, transaction_id)
+
+                    with self.assertRaises(ValueError):
+                        with conn.cursor() as cur:
+                            cur.arraysize = 50
+                            cur.execute(sql)
+                            transaction_id = self.get_paging_transaction_id(cur)
+                            self.assertEqual(cur.fetchone()[0], 1)
+                            raise ValueError()
+                    self.assertTransactionEnded(conn, transaction_id)
+                    # Only reads ran, so a lazy connection never began a transaction of its own
+                    self.assertIsNone(conn._transaction_id)
+
+    def test_prefetch_pages(self):
+        if self.using_mysql:
+            self.skipTest("Not implemented for MySQL")
+        prefetch_pages = aurora_data_api.defaults.prefetch_pages
+        aurora_data_api.defaults.prefetch_pages = True
+        try:
+            for transaction in "eager", "none":
+                with self.subTest(transaction=transaction):
+                    with aurora_data_api.connect(database=self.db_name, transaction=transaction) as conn:
+                        with conn.cursor() as cur:
+                            cur.arraysize = 50
+                            # Abandon the query past the first page, while the next page is being prefetched
+                            cur.execute(self.paginated_query)
+                            self.assertEqual([row[0] for row in cur.fetchmany(60)], list(range(1, 61)))
+                            cur.execute("select count(*) from aurora_data_api_test")
+                            self.assertEqual(cur.fetchone(), (2048,))
+
+                            cur.execute(self.paginated_query)
+                            self.assertEqual([row[0] for row in cur.fetchall()], list(range(1, 2049)))
+                            self.assertEqual([column.name for column in cur.description], ["id", "concat"])
+                            cur.execute("select count(*) from aurora_data_api_test")
+                            self.assertEqual(cur.fetchone(), (2048,))
+        finally:
+            aurora_data_api.defaults.prefetch_pages = prefetch_pages
 
     @unittest.skip(
         "This test now fails because the API was changed to terminate and delete the transaction when the "
@@ -152,7 +277,7 @@ class TestAuroraDataAPI(unittest.TestCase):
     )
     def test_pagination_backoff(self):
         if self.using_mysql:
-            return
+            self.skipTest("Not implemented for MySQL")
         with aurora_data_api.connect(database=self.db_name) as conn, conn.cursor() as cur:
             sql_template = "select concat({}) from aurora_data_api_test"
             sql = sql_template.format(", ".join(["cast(doc as text)"] * 64))
@@ -168,22 +293,29 @@ class TestAuroraDataAPI(unittest.TestCase):
                 cur.fetchall()
 
     def test_postgres_exceptions(self):
+        # Error classes are created on first access; aliases resolve to the class of their canonical name, and
+        # instances unpickle to the same class
+        er_undef_table = aurora_data_api.exceptions.PostgreSQLError.ER_UNDEF_TABLE
+        self.assertIs(type(pickle.loads(pickle.dumps(er_undef_table("x")))), er_undef_table)
+        self.assertIs(
+            aurora_data_api.MySQLError.ER_WRONG_EXPR_IN_PARTITION_FUNC_ERROR,
+            aurora_data_api.MySQLError.ER_CONST_EXPR_IN_PARTITION_FUNC_ERROR,
+        )
         if self.using_mysql:
-            return
-        with aurora_data_api.connect(database=self.db_name) as conn, conn.cursor() as cur:
+            self.skipTest("Not implemented for MySQL")
+        with aurora_data_api.connect(database=self.db_name, transaction="lazy") as conn, conn.cursor() as cur:
             table = "aurora_data_api_nonexistent_test_table"
             with self.assertRaises(aurora_data_api.exceptions.PostgreSQLError.ER_UNDEF_TABLE) as e:
                 sql = f"select * from {table}"
                 cur.execute(sql)
             self.assertTrue(f'relation "{table}" does not exist' in str(e.exception))
             self.assertTrue(isinstance(e.exception.response, dict))
+            self.assertIs(type(pickle.loads(pickle.dumps(e.exception))), er_undef_table)
 
     def test_rowcount(self):
-        with aurora_data_api.connect(database=self.db_name) as conn, conn.cursor() as cur:
+        with aurora_data_api.connect(database=self.db_name, transaction="lazy") as conn, conn.cursor() as cur:
             cur.execute("select * from aurora_data_api_test limit 8")
             self.assertEqual(cur.rowcount, 8)
-
-        with aurora_data_api.connect(database=self.db_name) as conn, conn.cursor() as cur:
             cur.execute("select * from aurora_data_api_test limit 9000")
             self.assertEqual(cur.rowcount, 2048)
 
@@ -195,8 +327,10 @@ class TestAuroraDataAPI(unittest.TestCase):
                 "INSERT INTO aurora_data_api_test(name, doc) VALUES (:name, CAST(:doc AS JSONB))",
                 [
                     {
-                        "name": "rowcount{}".format(i),
-                        "doc": json.dumps({"x": i, "y": str(i), "z": [i, i * i, i**i if i < 512 else 0]}),
+                        "name": f"rowcount{i}",
+                        "doc": json.dumps(
+                            {"x": i, "y": str(i), "z": [i, i * i, i**i if i < 512 else 0]}, separators=(",", ":")
+                        ),
                     }
                     for i in range(8)
                 ],